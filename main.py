@@ -1,5 +1,7 @@
 import csv
+import io
 import os
+import sys
 
 # Custom Exceptions
 class RoomNotFoundError(Exception):
@@ -14,57 +16,182 @@ class RoomAlreadyExistsError(Exception):
     # Error when trying to create a room that already exists.
     pass
 
+# Building names are interned to small ints so filters compare ints, not strings.
+# buildings[id] gives the name back.
+building_to_id = {}
+buildings = []
+
+def intern_building(name):
+    # Returns the id for a building name, giving it a new one the first time.
+    building_id = building_to_id.get(name)
+    if building_id is None:
+        building_id = len(buildings)
+        building_to_id[name] = building_id
+        buildings.append(name)
+    return building_id
+
+# Hour lookup tables, built once so hot paths index a table instead of
+# calling int() or formatting a string for every hour.
+# HOUR_STR[h] is how an hour is shown ("9:00"), HOUR_FROM_STR maps "9" to 9,
+# and HOUR_BIT maps "9" to its bit in booked_mask.
+HOUR_STR = [f"{h}:00" for h in range(24)]
+HOUR_FROM_STR = {str(h): h for h in range(24)}
+HOUR_BIT = {str(h): 1 << h for h in range(24)}
+
+def parse_hour(h_str):
+    # Turns an hour string into an int, using the table for "0".."23".
+    # Anything else goes through int(), so bad input still raises ValueError.
+    hour = HOUR_FROM_STR.get(h_str)
+    if hour is None:
+        hour = int(h_str)
+    return hour
+
 # Room Class
 class Room:
     # Represents a single classroom with its booking schedule.
-    def __init__(self, room_no, building, capacity):
+    # Booked hours are kept as bits of an int: bit h is set when hour h is booked.
+    # free_mask is the opposite (bit h set when hour h is free), kept alongside
+    # so searches can test a precomputed bit without a method call.
+    ALL_HOURS_MASK = (1 << 24) - 1
+
+    def __init__(self, room_no, building, capacity, booked_mask=0):
         self.room_no = room_no
         self.building = building
+        self.building_id = intern_building(building)
         self.capacity = capacity
-        self.booked_hours = []
+        self.booked_mask = booked_mask
+        self.free_mask = ~booked_mask & Room.ALL_HOURS_MASK
+        self._pretty_schedule = None
 
     def is_available(self, hour):
-        if hour in self.booked_hours:
-            return False
-        else:
-            return True
+        return (self.free_mask >> hour) & 1 == 1
 
     def book_hour(self, hour):
         # Books the room for a given hour.
         if not self.is_available(hour):
             raise TimeslotAlreadyBookedError(
-                f"Timeslot {hour}:00 is already booked for room {self.room_no}"
+                f"Timeslot {HOUR_STR[hour]} is already booked for room {self.room_no}"
             )
         
-        self.booked_hours.append(hour)
-        self.booked_hours.sort()
+        self.booked_mask |= 1 << hour
+        self.free_mask = ~self.booked_mask & Room.ALL_HOURS_MASK
+        self._pretty_schedule = None
         return True
 
     def display_details(self):
         # Prints the details for this room.
-        print(f"- Room Details: {self.room_no} -")
-        print(f"  Building: {self.building}")
-        print(f"  Capacity: {self.capacity}")
+        # The schedule line is only rebuilt after a new booking.
+        if self._pretty_schedule is None:
+            if not self.booked_mask:
+                self._pretty_schedule = "  Schedule: This room is free all day."
+            else:
+                pretty_hours = [HOUR_STR[h] for h in range(24) if (self.booked_mask >> h) & 1]
+                self._pretty_schedule = f"  Schedule (Booked Hours): {', '.join(pretty_hours)}"
         
-        if not self.booked_hours:
-            print("  Schedule: This room is free all day.")
-        else:
-            pretty_hours = []
-            for h in self.booked_hours:
-                pretty_hours.append(f"{h}:00")
-            print(f"  Schedule (Booked Hours): {', '.join(pretty_hours)}")
-        print("-----------")
+        # Everything goes out in one print instead of one per line.
+        lines = [
+            f"- Room Details: {self.room_no} -",
+            f"  Building: {self.building}",
+            f"  Capacity: {self.capacity}",
+            self._pretty_schedule,
+            "-----------",
+        ]
+        print("\n".join(lines))
 
 
 # Helper Functions
 
+# Index of every known room keyed by room_no, kept in step with all_rooms.
+# all_rooms keeps the creation order for find/save, this gives O(1) lookups.
+rooms_by_id = {}
+
+# Rooms grouped by building id, in the order they were created.
+# There is deliberately no per-hour index of free rooms: most rooms are free
+# most of the day, so it would hold every room in ~20 of its 24 buckets,
+# cost far more memory and load time than it saves, and barely narrow an
+# hour search. The hour check stays a cheap bit test per room instead.
+rooms_by_building = {}
+
+def index_room(all_rooms, room):
+    # Adds a room to all_rooms and to every lookup index.
+    all_rooms.append(room)
+    rooms_by_id[room.room_no] = room
+    rooms_by_building.setdefault(room.building_id, []).append(room)
+
+def candidate_rooms(all_rooms, building, hour):
+    # Returns the rooms in the given building that are free at the given hour.
+    # Either filter may be skipped by passing an empty building or None for
+    # the hour. The building comes from rooms_by_building and the hour is a
+    # single bit test on each room's free_mask.
+    if building:
+        rooms = rooms_by_building.get(building_to_id.get(building, -1), [])
+    else:
+        rooms = all_rooms
+    
+    if hour is None:
+        return rooms
+    
+    hour_bit = 1 << hour
+    return [room for room in rooms if room.free_mask & hour_bit]
+
 def find_room_by_id(all_rooms, room_no):
-    # A helper function to find a Room object in a list by its room_no.
+    # A helper function to find a Room object by its room_no.
     # Returns the Room object or None if not found.
-    for room in all_rooms:
-        if room.room_no == room_no:
-            return room
-    return None
+    return rooms_by_id.get(room_no)
+
+def parse_booked_hours(booked_hours_str):
+    # Turns a "9;14" style schedule into a booked_mask.
+    # Returns None if any of the hours isn't 0-23.
+    booked_mask = 0
+    if booked_hours_str:
+        for h_str in booked_hours_str.split(';'):
+            bit = HOUR_BIT.get(h_str)
+            if bit is None:
+                # Not in the table (e.g. "09" or " 9"), so parse it properly.
+                try:
+                    hour = parse_hour(h_str)
+                except ValueError:
+                    return None
+                if not (0 <= hour <= 23):
+                    return None
+                bit = 1 << hour
+            booked_mask |= bit
+    return booked_mask
+
+def parse_capacity(capacity_str):
+    # Turns a capacity string into an int, or returns None if it isn't a whole
+    # number of 0 or more. Creating and loading rooms both go through this,
+    # so any room that gets saved can be loaded back.
+    capacity_str = capacity_str.strip()
+    # isdecimal() rather than isdigit(): '²' is a digit but int() rejects it.
+    if not capacity_str.isdecimal():
+        return None
+    return int(capacity_str)
+
+def read_csv_rows(text):
+    # Yields (line_no, row, raw) for each record in some CSV text, where raw is
+    # the record's exact text so a skipped record can be kept elsewhere.
+    # Records the csv module can't parse (e.g. a field over the size limit)
+    # come back with row set to None, so callers can report them and carry on.
+    lines = io.StringIO(text, newline='').readlines()
+    reader = csv.reader(lines)
+    start = 0
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error:
+            row = None
+        end = reader.line_num
+        yield end, row, "".join(lines[start:end])
+        start = end
+
+def keep_skipped_rows(side_filename, raw_rows):
+    # Appends records that couldn't be loaded to a side file, so the next save
+    # doesn't lose them for good.
+    with open(side_filename, mode='a', newline='') as file:
+        file.write("".join(raw_rows))
 
 def load_rooms_from_csv(filename):
     # Loads all room data from the CSV file when the program starts.
@@ -76,80 +203,272 @@ def load_rooms_from_csv(filename):
         return all_rooms
 
     print(f"Loading data from '{filename}'...")
+    # Only reading the file itself can fail as a whole. Bad rows are checked
+    # one by one below and skipped, so one broken line doesn't lose the rest.
     try:
+        # Read the whole snapshot with one call and let the C csv parser work
+        # over the text in memory instead of pulling from the file per row.
+        # The csv module finds the record endings itself; str.splitlines()
+        # would also split on characters like \u2028 inside a field.
         with open(filename, mode='r', newline='') as file:
-            reader = csv.reader(file)
-            
-            header = next(reader) 
-            
-            for row in reader:
-                room_no = row[0]
-                building = row[1]
-                capacity = int(row[2])
-                booked_hours_str = row[3]
-                
-                new_room = Room(room_no, building, capacity)
-                
-                if booked_hours_str:
-                    hour_strings = booked_hours_str.split(';')
-                    for h_str in hour_strings:
-                        new_room.booked_hours.append(int(h_str))
-                
-                all_rooms.append(new_room)
-                
-        print(f"Successfully loaded {len(all_rooms)} rooms.")
-    except Exception as e:
+            text = file.read()
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Error loading file: {e}. Starting with an empty system.")
-        return []
+        return all_rooms
+    
+    # Raw text of every row that is skipped, kept in a side file afterwards.
+    skipped_rows = []
+    
+    # Globals and builtins used in the loop, bound to locals once so each
+    # row does fast local lookups.
+    _Room = Room
+    _index_room = index_room
+    _parse_booked_hours = parse_booked_hours
+    _parse_capacity = parse_capacity
+    
+    rows = read_csv_rows(text)
+    header = next(rows, None)
+    
+    for line_no, row, raw in rows:
+        if row is None:
+            print(f"Skipping unreadable row on line {line_no}.")
+            skipped_rows.append(raw)
+            continue
+        if not row:
+            continue
+        if len(row) < 4:
+            print(f"Skipping bad row on line {line_no}: {row}")
+            skipped_rows.append(raw)
+            continue
+        
+        # Any columns past the fourth are ignored, as they always were.
+        room_no, building, capacity_str, booked_hours_str = row[:4]
+        
+        capacity = _parse_capacity(capacity_str)
+        booked_mask = _parse_booked_hours(booked_hours_str)
+        if capacity is None or booked_mask is None:
+            print(f"Skipping bad row on line {line_no}: {row}")
+            skipped_rows.append(raw)
+            continue
+        if room_no in rooms_by_id:
+            print(f"Skipping duplicate room '{room_no}' on line {line_no}.")
+            skipped_rows.append(raw)
+            continue
+        
+        _index_room(all_rooms, _Room(room_no, building, capacity, booked_mask))
+    
+    print(f"Successfully loaded {len(all_rooms)} rooms.")
+    if skipped_rows:
+        skipped_filename = filename + ".skipped"
+        try:
+            keep_skipped_rows(skipped_filename, skipped_rows)
+            print(f"{len(skipped_rows)} bad rows were skipped and kept in '{skipped_filename}'.")
+        except OSError as e:
+            print(f"{len(skipped_rows)} bad rows were skipped, but could not be kept: {e}")
         
     return all_rooms
 
 def save_rooms_to_csv(filename, all_rooms):
     # Saves the final state of all rooms to a csv file.
+    # The whole file is built in memory first and written with a single call,
+    # into a temp file that then replaces the old CSV in one step.
     print(f"Saving data to '{filename}'...")
+    temp_filename = filename + ".tmp"
     try:
-        with open(filename, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            
-            writer.writerow(["room_no", "building", "capacity", "booked_hours"])
-            
-            for room in all_rooms:
-                hour_strings = []
-                for h in room.booked_hours:
-                    hour_strings.append(str(h))
-                booked_hours_str = ";".join(hour_strings)
-                
-                writer.writerow([
-                    room.room_no, 
-                    room.building, 
-                    room.capacity, 
-                    booked_hours_str
-                ])
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        
+        writer.writerow(["room_no", "building", "capacity", "booked_hours"])
+        
+        writer.writerows(
+            [
+                room.room_no,
+                room.building,
+                room.capacity,
+                ";".join(h_str for h_str, bit in HOUR_BIT.items() if room.booked_mask & bit)
+            ]
+            for room in all_rooms
+        )
+        
+        with open(temp_filename, mode='w', newline='') as file:
+            file.write(buffer.getvalue())
+        os.replace(temp_filename, filename)
         print("Data saved successfully.")
+        return True
     except Exception as e:
         print(f"Error saving data: {e}")
+        # Don't leave a half-written temp file behind.
+        try:
+            os.remove(temp_filename)
+        except OSError:
+            pass
+        return False
+
+
+# Journal
+# Every create/book is appended to a small journal file as soon as it happens,
+# so a change costs one short write instead of rewriting the whole CSV and a
+# crash doesn't lose bookings. The CSV is only rewritten (and the journal
+# emptied) on a clean exit.
+
+journal_file = None
+
+def open_journal(filename):
+    # Opens the journal for appending. Called once at startup.
+    global journal_file
+    journal_file = open(filename, mode='a', newline='')
+
+def append_to_journal(*fields):
+    # Writes one operation to the journal and flushes it straight away.
+    if journal_file is None:
+        return
+    csv.writer(journal_file).writerow(fields)
+    journal_file.flush()
+
+def replay_journal(filename, all_rooms):
+    # Re-applies the operations saved in the journal on top of the CSV snapshot.
+    # Operations already present in the snapshot are skipped, so replaying
+    # after a save that wasn't followed by a truncate is harmless.
+    # Bad lines are reported and moved to a side file, so the journal can
+    # still be emptied as normal on exit.
+    if not os.path.exists(filename):
+        return
+    
+    bad_filename = filename + ".bad"
+    
+    try:
+        with open(filename, mode='r', newline='') as file:
+            text = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        # Nothing in it can be replayed, so move the whole file aside.
+        print(f"Error replaying journal: {e}")
+        try:
+            with open(filename, mode='rb') as file, open(bad_filename, mode='ab') as bad_file:
+                bad_file.write(file.read())
+            os.remove(filename)
+            print(f"Moved the journal to '{bad_filename}'.")
+        except OSError as e:
+            print(f"Could not move the journal aside: {e}")
+        return
+    
+    replayed = 0
+    bad_lines = []
+    
+    for line_no, row, raw in read_csv_rows(text):
+        # row is None for a line the csv module couldn't parse at all.
+        if row is not None and not row:
+            continue
+        op = row[0] if row else None
+        
+        if op == "CREATE" and len(row) == 4:
+            capacity = parse_capacity(row[3])
+            if capacity is not None:
+                room_no, building = row[1], row[2]
+                if room_no not in rooms_by_id:
+                    index_room(all_rooms, Room(room_no, building, capacity))
+                    replayed += 1
+                continue
+        
+        if op == "BOOK" and len(row) == 3 and row[2] in HOUR_FROM_STR:
+            room = rooms_by_id.get(row[1])
+            if room is not None:
+                hour = HOUR_FROM_STR[row[2]]
+                if room.is_available(hour):
+                    room.book_hour(hour)
+                    replayed += 1
+                continue
+        
+        print(f"Skipping bad journal line {line_no}: {row}")
+        bad_lines.append(raw)
+    
+    if replayed:
+        print(f"Recovered {replayed} unsaved changes from '{filename}'.")
+    if bad_lines:
+        try:
+            keep_skipped_rows(bad_filename, bad_lines)
+            print(f"{len(bad_lines)} journal lines could not be replayed and were moved to '{bad_filename}'.")
+        except OSError as e:
+            print(f"{len(bad_lines)} journal lines could not be replayed or kept: {e}")
+
+def compact_journal(csv_filename, journal_filename, all_rooms):
+    # Writes the full state to the CSV and empties the journal.
+    # The journal is kept if the CSV could not be written.
+    if not save_rooms_to_csv(csv_filename, all_rooms):
+        return
+    if journal_file is not None:
+        journal_file.truncate(0)
+        journal_file.close()
+    elif os.path.exists(journal_filename):
+        os.remove(journal_filename)
+
+
+# Main Functionality
+
+def create_room(all_rooms, room_no, building, capacity):
+    # Creates a new room and records it in the journal.
+    if room_no in rooms_by_id:
+        raise RoomAlreadyExistsError(f"Room with ID '{room_no}' already exists.")
+    if capacity < 0:
+        raise ValueError("Capacity must be a whole number, 0 or more.")
+    
+    new_room = Room(room_no, building, capacity)
+    index_room(all_rooms, new_room)
+    append_to_journal("CREATE", room_no, building, capacity)
+    return new_room
+
+def book_room(all_rooms, room_no, hour):
+    # Books an hour in an existing room and records it in the journal.
+    room = find_room_by_id(all_rooms, room_no)
+    
+    if room is None:
+        raise RoomNotFoundError(f"Room with ID '{room_no}' was not found.")
+    if not (0 <= hour <= 23):
+        raise ValueError("Hour must be between 0 and 23.")
+    
+    room.book_hour(hour)
+    append_to_journal("BOOK", room_no, hour)
+    return room
 
+def find_rooms(all_rooms, building, min_capacity, hour):
+    # Returns the rooms matching the given filters.
+    # An empty building or None for min_capacity/hour skips that filter.
+    # The building and hour filters are answered by candidate_rooms, so only
+    # the capacity check can be left to do per room, and the loop is only
+    # run when that filter is actually set.
+    candidates = candidate_rooms(all_rooms, building, hour)
+    
+    if min_capacity is None:
+        return list(candidates)
+    return [room for room in candidates if room.capacity >= min_capacity]
+
+def print_find_results(results):
+    # Prints the rooms found by a search.
+    if not results:
+        print("\nNo rooms found.")
+    else:
+        print(f"\nFound {len(results)} matching rooms:")
+        for room in results:
+            room.display_details()
 
-# Main Functionality Handlers
+
+# Interactive Handlers
 
 def handle_create_room(all_rooms):
     # Adds new room details.
     print("\n- Create a New Room -")
     room_no = input("Enter Room No. (e.g., '6101'): ")
     
-    if find_room_by_id(all_rooms, room_no) is not None:
+    if room_no in rooms_by_id:
         raise RoomAlreadyExistsError(f"Room with ID '{room_no}' already exists.")
         
     building = input("Enter Building Name (e.g., 'NAB'): ")
     
-    try:
-        capacity = int(input("Enter Capacity (e.g., 50): "))
-    except ValueError:
-        print("Error: Capacity must be a number.")
+    capacity = parse_capacity(input("Enter Capacity (e.g., 50): "))
+    if capacity is None:
+        print("Error: Capacity must be a whole number, 0 or more.")
         return
 
-    new_room = Room(room_no, building, capacity)
-    all_rooms.append(new_room)
+    create_room(all_rooms, room_no, building, capacity)
     print(f"Success: Room '{room_no}' created in {building}.")
 
 def handle_book_room(all_rooms):
@@ -157,13 +476,11 @@ def handle_book_room(all_rooms):
     print("\n- Book a Room -")
     room_no = input("Enter Room No. to book: ")
     
-    room = find_room_by_id(all_rooms, room_no)
-    
-    if room is None:
+    if room_no not in rooms_by_id:
         raise RoomNotFoundError(f"Room with ID '{room_no}' was not found.")
     
     try:
-        hour = int(input("Enter hour to book (0-23): "))
+        hour = parse_hour(input("Enter hour to book (0-23): "))
         if not (0 <= hour <= 23):
             print("Error: Hour must be between 0 and 23.")
             return
@@ -171,8 +488,8 @@ def handle_book_room(all_rooms):
         print("Error: Hour must be a number.")
         return
 
-    room.book_hour(hour)
-    print(f"Success: Room '{room_no}' has been booked for {hour}:00.")
+    book_room(all_rooms, room_no, hour)
+    print(f"Success: Room '{room_no}' has been booked for {HOUR_STR[hour]}.")
 
 def handle_find_rooms(all_rooms):
     # Lets user search for rooms based on different filters.
@@ -183,44 +500,27 @@ def handle_find_rooms(all_rooms):
     filter_capacity_str = input("Filter by minimum capacity: ")
     filter_hour_str = input("Filter by hour available (0-23): ")
     
-    results = []
+    # Parse and check the inputs once, before looking at any rooms.
+    min_capacity = None
+    if filter_capacity_str:
+        try:
+            min_capacity = int(filter_capacity_str)
+        except ValueError:
+            print("Error: Capacity must be a number.")
+            return
     
-    for room in all_rooms:
-        matches = True
-        
-        # 1. Check building filter
-        if filter_building and room.building != filter_building:
-            matches = False
-            
-        # 2. Check capacity filter
-        if filter_capacity_str:
-            try:
-                min_capacity = int(filter_capacity_str)
-                if room.capacity < min_capacity:
-                    matches = False
-            except ValueError:
-                print("Invalid capacity input.")
-                
-        # 3. Check availability filter
-        if filter_hour_str:
-            try:
-                hour = int(filter_hour_str)
-                if not (0 <= hour <= 23):
-                    print("Invalid hour.")
-                elif not room.is_available(hour):
-                    matches = False
-            except ValueError:
-                print("Invalid hour input.")
-        
-        if matches:
-            results.append(room)
-
-    if not results:
-        print("\nNo rooms found.")
-    else:
-        print(f"\nFound {len(results)} matching rooms:")
-        for room in results:
-            room.display_details()
+    hour = None
+    if filter_hour_str:
+        try:
+            hour = parse_hour(filter_hour_str)
+        except ValueError:
+            print("Error: Hour must be a number.")
+            return
+        if not (0 <= hour <= 23):
+            print("Error: Hour must be between 0 and 23.")
+            return
+    
+    print_find_results(find_rooms(all_rooms, filter_building, min_capacity, hour))
 
 def handle_view_schedule(all_rooms):
     # Displays the details and schedule for a specific room.
@@ -235,44 +535,131 @@ def handle_view_schedule(all_rooms):
     room.display_details()
 
 
-csv_filename = "data.csv"
+# Batch Mode
+# Runs commands from a file instead of the menu, one per line, e.g.
+#   CREATE,6101,NAB,50
+#   BOOK,6101,9
+#   FIND,NAB,40,10      (leave a field empty to skip that filter)
+#   VIEW,6101
+# Blank lines and lines starting with '#' are ignored.
 
-all_rooms = load_rooms_from_csv(csv_filename)
+def run_command(command, args, all_rooms):
+    # Runs a single batch command. Raises on bad input, like the handlers.
+    if command == "CREATE":
+        room_no, building, capacity_str = args
+        capacity = parse_capacity(capacity_str)
+        if capacity is None:
+            raise ValueError("Capacity must be a whole number, 0 or more.")
+        create_room(all_rooms, room_no, building, capacity)
+        
+    elif command == "BOOK":
+        room_no, hour_str = args
+        book_room(all_rooms, room_no, parse_hour(hour_str))
+        
+    elif command == "FIND":
+        building, capacity_str, hour_str = args
+        min_capacity = int(capacity_str) if capacity_str else None
+        hour = parse_hour(hour_str) if hour_str else None
+        if hour is not None and not (0 <= hour <= 23):
+            raise ValueError("Hour must be between 0 and 23.")
+        print_find_results(find_rooms(all_rooms, building, min_capacity, hour))
+        
+    elif command == "VIEW":
+        (room_no,) = args
+        room = find_room_by_id(all_rooms, room_no)
+        if room is None:
+            raise RoomNotFoundError(f"Room with id '{room_no}' was not found.")
+        room.display_details()
+        
+    else:
+        raise ValueError(f"Unknown command '{command}'.")
 
-while True:
-    print("\n- Classroom Booking System")
-    print("What would you like to do?")
-    print("  1. Create a new room")
-    print("  2. Book a room")
-    print("  3. Find available rooms")
-    print("  4. View a room's schedule")
-    print("  5. Exit")
+def run_batch(filename, all_rooms):
+    # Runs every command in a batch file, reporting bad lines and carrying on.
+    try:
+        with open(filename, mode='r', newline='') as file:
+            text = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading batch file: {e}")
+        return
     
-    choice = input("Enter your choice (1-5): ")
+    for line_no, row, raw in read_csv_rows(text):
+        if row is None:
+            print(f"Error on line {line_no}: could not parse line.")
+            continue
+        
+        # Allow spaces around fields, e.g. "CREATE, 6101, NAB, 50".
+        fields = [field.strip() for field in row]
+        if not fields or fields[0].startswith('#') or fields == [""]:
+            continue
+        try:
+            run_command(fields[0].upper(), fields[1:], all_rooms)
+        except (RoomNotFoundError, TimeslotAlreadyBookedError, RoomAlreadyExistsError, ValueError) as e:
+            print(f"Error on line {line_no}: {e}")
+
+
+def run_interactive(all_rooms):
+    # The menu loop for a person at the keyboard.
+    while True:
+        print("\n- Classroom Booking System")
+        print("What would you like to do?")
+        print("  1. Create a new room")
+        print("  2. Book a room")
+        print("  3. Find available rooms")
+        print("  4. View a room's schedule")
+        print("  5. Exit")
+        
+        choice = input("Enter your choice (1-5): ")
+        
+        try:
+            if choice == '1':
+                handle_create_room(all_rooms)
+                
+            elif choice == '2':
+                handle_book_room(all_rooms)
+                
+            elif choice == '3':
+                handle_find_rooms(all_rooms)
+                
+            elif choice == '4':
+                handle_view_schedule(all_rooms)
+                
+            elif choice == '5':
+                break
+                
+            else:
+                print("Invalid choice. Please enter a number from 1 to 5.")
+        
+        except (RoomNotFoundError, TimeslotAlreadyBookedError, RoomAlreadyExistsError) as e:
+            print(f"\nError: {e}")
+        except Exception as e:
+            print(f"\nAn error occurred: {e}")
+        
+        input("\nPress Enter to continue...")
+
+
+def main():
+    csv_filename = "data.csv"
+    journal_filename = "data.journal"
     
-    try:
-        if choice == '1':
-            handle_create_room(all_rooms)
-            
-        elif choice == '2':
-            handle_book_room(all_rooms)
-            
-        elif choice == '3':
-            handle_find_rooms(all_rooms)
-            
-        elif choice == '4':
-            handle_view_schedule(all_rooms)
-            
-        elif choice == '5':
-            save_rooms_to_csv(csv_filename, all_rooms)
-            break
-            
-        else:
-            print("Invalid choice. Please enter a number from 1 to 5.")
-    
-    except (RoomNotFoundError, TimeslotAlreadyBookedError, RoomAlreadyExistsError) as e:
-        print(f"\nError: {e}")
-    except Exception as e:
-        print(f"\nAn error occurred: {e}")
+    # Usage: python main.py [--batch FILE]
+    args = sys.argv[1:]
+    if args and not (len(args) == 2 and args[0] == "--batch"):
+        print("Usage: python main.py [--batch FILE]")
+        return
     
-    input("\nPress Enter to continue...")
+    all_rooms = load_rooms_from_csv(csv_filename)
+    replay_journal(journal_filename, all_rooms)
+    
+    if args:
+        # A batch file can simply be run again, so batch mode skips the
+        # journal and saves everything once at the end.
+        run_batch(args[1], all_rooms)
+    else:
+        open_journal(journal_filename)
+        run_interactive(all_rooms)
+    
+    compact_journal(csv_filename, journal_filename, all_rooms)
+
+if __name__ == "__main__":
+    main()